@@ -0,0 +1,93 @@
+import json
+import os
+import platform
+import statistics
+import time
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+DATA_ROOT = os.path.join(os.path.dirname(__file__), "data")
+RESULTS_ROOT = os.path.join(os.path.dirname(__file__), "results")
+
+JOB_DESCRIPTIONS = [
+    "Senior backend developer with Python, FastAPI and PostgreSQL experience in FinTech",
+    "Frontend engineer building React and TypeScript dashboards",
+    "DevOps engineer to automate CI/CD pipelines and migrate services to Kubernetes on AWS",
+    "Machine learning engineer to train and deploy PyTorch models for recommendations",
+    "QA engineer writing unit and integration tests for a healthcare platform",
+]
+
+def parse_sizes(value: str):
+    """'1k,10k' -> [('1k', 1000), ('10k', 10000)]; plain integers are accepted too."""
+    sizes = []
+    for name in value.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        sizes.append((name, SIZES[name] if name in SIZES else int(name)))
+    return sizes
+
+def data_dir(size_name: str) -> str:
+    return os.path.join(DATA_ROOT, size_name)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+def summarize(samples):
+    """Latency stats in milliseconds for a list of durations in seconds."""
+    ms = [s * 1000 for s in samples]
+    if not ms:
+        return {"n": 0}
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "min_ms": round(min(ms), 3),
+        "max_ms": round(max(ms), 3),
+    }
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def save_results(name: str, results: dict, path: str = None) -> str:
+    path = path or os.path.join(RESULTS_ROOT, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = {
+        "benchmark": name,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+def compare_results(current: dict, baseline_path: str, metric: str = "p50_ms", threshold: float = 0.2):
+    """
+    Compare current results against a saved baseline file.
+    Prints one line per shared entry and returns the entries that got slower
+    than baseline by more than `threshold` (0.2 == 20%).
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for key, stats in current.items():
+        old = baseline.get(key, {}).get(metric)
+        new = stats.get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        flag = "REGRESSION" if change > threshold else ""
+        print(f"{key:<40} {old:>12.3f} -> {new:>12.3f} {metric} ({change:+.1%}) {flag}")
+        if change > threshold:
+            regressions.append(key)
+    return regressions
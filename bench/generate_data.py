@@ -0,0 +1,213 @@
+"""
+Generate synthetic HRM / xOPS / custom files for benchmarking.
+
+    python -m bench.generate_data --sizes 1k,10k,100k
+
+Writes bench/data/<size>/{hrm,xops,custom}.json in the same shape as data/.
+xOPS and custom records reference employees the way real exports do: mostly
+by the HRM id, but also by reformatted ids, mismatched ids with a matching
+email / phone, typo'd names, and a few employees HRM does not know about,
+so every branch of find_best_match gets exercised.
+"""
+import argparse
+import json
+import os
+import random
+from difflib import get_close_matches
+from bench.common import data_dir, parse_sizes
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Carol", "David", "Eve", "Frank", "Grace", "Hannah", "Ivan", "Julia",
+    "Kevin", "Laura", "Marko", "Nina", "Oscar", "Petra", "Quinn", "Rachel", "Stefan", "Tina",
+    "Uros", "Vera", "Walter", "Xenia", "Yusuf", "Zoran", "Ana", "Milan", "Jelena", "Nikola",
+    "Sofia", "Lukas", "Emma", "Noah", "Mia", "Liam", "Olivia", "Ethan", "Ava", "Mateo",
+]
+LAST_NAMES = [
+    "Johnson", "Smith", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Petrovic", "Jovanovic",
+    "Nikolic", "Markovic", "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Martin", "Lee", "Clark",
+    "Lewis", "Walker", "Hall", "Young", "King", "Wright", "Lopez", "Hill", "Scott", "Green",
+    "Adams", "Baker", "Nelson", "Carter", "Mitchell", "Perez", "Roberts", "Turner", "Phillips", "Campbell",
+]
+SENIORITY = ["Junior", "", "Senior", "Lead", "Principal", "Staff"]
+ROLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "DevOps Engineer", "Data Scientist",
+    "QA Engineer", "Machine Learning Engineer", "Mobile Developer", "Cloud Architect", "Engineering Manager",
+]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "C#", "C++", "Kotlin", "Swift", "SQL",
+    "React", "Angular", "Vue", "Django", "FastAPI", "Spring Boot", "Node.js", "Docker", "Kubernetes",
+    "AWS", "Azure", "GCP", "Terraform", "PostgreSQL", "MongoDB", "Kafka", "Redis", "PyTorch", "TensorFlow",
+]
+DOMAINS = [
+    "FinTech", "Cloud Services", "Data Analytics", "Software QA", "Artificial Intelligence",
+    "Web Development", "E-commerce", "Healthcare", "Automotive", "Telecommunications",
+]
+RESPONSIBILITIES = [
+    "Developed backend APIs", "Built reusable UI components", "Automated CI/CD pipelines",
+    "Designed data models", "Wrote unit and integration tests", "Mentored junior developers",
+    "Optimized database queries", "Migrated services to Kubernetes", "Trained and deployed ML models",
+    "Led code reviews", "Improved observability and alerting", "Integrated third-party payment providers",
+]
+PROJECT_NOUNS = ["Payment Gateway", "Mobile App", "Data Platform", "Customer Portal", "Recommendation Engine",
+                 "Billing Service", "Analytics Dashboard", "Search API", "Inventory System", "Chatbot"]
+EDUCATION = ["BSc Computer Science", "MSc Computer Science", "BSc Electrical Engineering",
+             "MSc Data Science", "BSc Mathematics", "PhD Machine Learning", ""]
+
+# How xOPS / custom records point at an employee.
+LINK_WEIGHTS = {
+    "exact_id": 0.64,
+    "formatted_id": 0.12,   # "00012" -> "000-12", matched after normalize_string
+    "email": 0.10,          # unknown id, matching email
+    "phone": 0.06,          # unknown id, matching phone
+    "typo_name": 0.08,      # unknown id, misspelled full_name (fuzzy match path)
+}
+# Share of employees missing from HRM (e.g. contractors); their xOPS / custom
+# rows carry the id, name and email a real export would.
+ORPHAN_RATE = 0.04
+# Orphans get a random surname of this many letters, re-drawn until the full
+# name is not a fuzzy match (find_best_match's cutoff) for any HRM employee or
+# other orphan, so each orphan merges into its own record.
+ORPHAN_SURNAME_LENGTH = 10
+NAME_MATCH_CUTOFF = 0.8
+CONSONANTS = "bcdfghjklmnprstvz"
+VOWELS = "aeiou"
+
+def typo(rnd: random.Random, text: str) -> str:
+    if len(text) < 4:
+        return text
+    i = rnd.randrange(1, len(text) - 2)
+    kind = rnd.choice(["swap", "drop", "double"])
+    if kind == "swap":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if kind == "drop":
+        return text[:i] + text[i + 1:]
+    return text[:i] + text[i] + text[i:]
+
+def random_date(rnd: random.Random, start_year: int, end_year: int) -> str:
+    return f"{rnd.randint(start_year, end_year)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}"
+
+def make_responsibilities(rnd: random.Random) -> str:
+    return ", ".join(rnd.sample(RESPONSIBILITIES, rnd.randint(1, 3)))
+
+def orphan_names(rnd: random.Random, count: int, taken):
+    """`count` full names, e.g. "Nina Kovazelitu", none a fuzzy match for `taken` or each other."""
+    names, seen = [], sorted({name.lower() for name in taken})
+    while len(names) < count:
+        surname = "".join(rnd.choice(VOWELS if k % 2 else CONSONANTS) for k in range(ORPHAN_SURNAME_LENGTH))
+        name = f"{rnd.choice(FIRST_NAMES)} {surname.capitalize()}"
+        if not get_close_matches(name.lower(), seen, n=1, cutoff=NAME_MATCH_CUTOFF):
+            names.append(name)
+            seen.append(name.lower())
+    return names
+
+def make_email(full_name: str, i: int) -> str:
+    first, last = full_name.lower().split(" ", 1)
+    return f"{first}.{last}{i}@dummy.com"
+
+def make_employee(rnd: random.Random, i: int):
+    first, last = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+    seniority = rnd.choice(SENIORITY)
+    history, year = [], rnd.randint(2005, 2018)
+    for _ in range(rnd.randint(0, 4)):
+        end_year = min(year + rnd.randint(1, 4), 2025)
+        history.append({
+            "role": rnd.choice(ROLES),
+            "organization": f"{rnd.choice(LAST_NAMES)} {rnd.choice(['Labs', 'Systems', 'Tech', 'Solutions'])}",
+            "start_date": random_date(rnd, year, year),
+            "end_date": random_date(rnd, end_year, end_year),
+            "responsibilities": make_responsibilities(rnd),
+        })
+        year = end_year
+    return {
+        "employee_id": f"{i:05d}",
+        "full_name": f"{first} {last}",
+        "email": make_email(f"{first} {last}", i),
+        "phone": f"+1-555-{i:07d}",
+        "current_role": f"{seniority} {rnd.choice(ROLES)}".strip(),
+        "employment_history": history,
+        "education": rnd.choice(EDUCATION),
+    }
+
+def link_fields(rnd: random.Random, employee, n: int):
+    """Identifying fields for an xOPS / custom record pointing at `employee`."""
+    kind = rnd.choices(list(LINK_WEIGHTS), weights=list(LINK_WEIGHTS.values()))[0]
+    eid = employee["employee_id"]
+    unknown_id = f"X{n + rnd.randrange(n * 10):07d}"
+    if kind == "exact_id":
+        return {"employee_id": eid}
+    if kind == "formatted_id":
+        return {"employee_id": f"{eid[:3]}-{eid[3:]}"}
+    if kind == "email":
+        return {"employee_id": unknown_id, "email": employee["email"].upper()}
+    if kind == "phone":
+        return {"employee_id": unknown_id, "phone": employee["phone"]}
+    return {"employee_id": unknown_id, "full_name": typo(rnd, employee["full_name"])}
+
+def orphan_fields(employee):
+    """Identifying fields for a record of an employee HRM does not know about."""
+    return {key: employee[key] for key in ["employee_id", "full_name", "email"]}
+
+def make_projects(rnd: random.Random, pid_start: int):
+    return [{
+        "project_id": f"P{pid_start + k}",
+        "project_name": f"{rnd.choice(PROJECT_NOUNS)} {rnd.choice(['', 'v2', 'Revamp', 'Migration'])}".strip(),
+        "role": rnd.choice(ROLES),
+        "responsibilities": make_responsibilities(rnd),
+        "performance_metrics": rnd.choice(["Delivered on time", "Improved latency by 15%", "Reduced costs by 10%", ""]),
+    } for k in range(rnd.randint(1, 3))]
+
+def generate(n: int, seed: int = 42, duplicate_rate: float = 0.02):
+    rnd = random.Random(seed)
+    orphans = set(rnd.sample(range(n), max(1, int(n * ORPHAN_RATE))))
+    employees = [make_employee(rnd, i + 1) for i in range(n)]
+    taken = {e["full_name"] for i, e in enumerate(employees) if i not in orphans}
+    for i, name in zip(sorted(orphans), orphan_names(rnd, len(orphans), taken)):
+        employees[i] = {**employees[i], "full_name": name, "email": make_email(name, i + 1)}
+
+    hrm = [e for i, e in enumerate(employees) if i not in orphans]
+    # Re-exported rows: same id, slightly different data (e.g. a later role update).
+    for e in rnd.sample(hrm, int(len(hrm) * duplicate_rate)):
+        hrm.append({**e, "current_role": f"Senior {rnd.choice(ROLES)}"})
+    rnd.shuffle(hrm)
+
+    xops, custom, pid = [], [], 1000
+    for i, e in enumerate(employees):
+        if i in orphans or rnd.random() < 0.9:
+            projects = make_projects(rnd, pid)
+            pid += len(projects)
+            ids = orphan_fields(e) if i in orphans else link_fields(rnd, e, n)
+            xops.append({**ids, "projects": projects})
+        if i in orphans or rnd.random() < 0.8:
+            ids = orphan_fields(e) if i in orphans else link_fields(rnd, e, n)
+            custom.append({
+                **ids,
+                "business_context": rnd.choice(DOMAINS),
+                "team_contributions": rnd.choice(["Improved throughput by 20%", "Reduced deployment times", ""]),
+                "skills": rnd.sample(SKILLS, rnd.randint(2, 8)),
+                "endorsements": rnd.sample(RESPONSIBILITIES, rnd.randint(0, 2)),
+            })
+    rnd.shuffle(xops)
+    rnd.shuffle(custom)
+    return hrm, xops, custom
+
+def write_dataset(out_dir: str, n: int, seed: int = 42):
+    os.makedirs(out_dir, exist_ok=True)
+    hrm, xops, custom = generate(n, seed)
+    for name, rows in [("hrm", hrm), ("xops", xops), ("custom", custom)]:
+        with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    return len(hrm), len(xops), len(custom)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic employee data for benchmarks.")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Comma-separated sizes (1k, 10k, 100k or integers)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for name, n in parse_sizes(args.sizes):
+        out = data_dir(name)
+        counts = write_dataset(out, n, args.seed)
+        print(f"✅ {name}: {counts[0]} HRM, {counts[1]} xOPS, {counts[2]} custom records -> {out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+End-to-end HTTP load test against a running API (see bench/stub_llm.py for setup).
+
+    python -m bench.load_test --base-url http://127.0.0.1:8000 --concurrency 16 --requests 500
+    python -m bench.load_test --baseline bench/results/load-<YYYYmmdd-HHMMSS>.json
+
+Scenarios: POST /rag/suggestions, GET /rag/employee, POST /cv/start/{query}.
+Reports client-side latency per scenario plus the server-side stage
+breakdown from the Server-Timing header.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+import httpx
+from bench.common import JOB_DESCRIPTIONS, compare_results, data_dir, save_results, summarize
+
+SCENARIO_WEIGHTS = {"suggestions": 0.5, "employee": 0.3, "cv_start": 0.2}
+
+def load_lookup_queries(size_name: str, rnd: random.Random, count: int = 200):
+    with open(f"{data_dir(size_name)}/hrm.json", "r", encoding="utf-8") as f:
+        hrm = json.load(f)
+    return [rnd.choice([rec["employee_id"], rec["full_name"], rec["email"]]) for rec in rnd.sample(hrm, min(count, len(hrm)))]
+
+def parse_server_timing(header: str):
+    spans = []
+    for part in (header or "").split(","):
+        name, _, dur = part.strip().partition(";dur=")
+        if name and dur:
+            spans.append((name, float(dur) / 1000))
+    return spans
+
+async def run_request(client: httpx.AsyncClient, scenario: str, rnd: random.Random, lookups):
+    if scenario == "suggestions":
+        return await client.post("/rag/suggestions", json={"job_description": rnd.choice(JOB_DESCRIPTIONS), "top_k": 5})
+    if scenario == "employee":
+        return await client.get("/rag/employee", params={"query": rnd.choice(lookups)})
+    return await client.post(f"/cv/start/{rnd.choice(lookups)}")
+
+async def run(args):
+    rnd = random.Random(args.seed)
+    lookups = load_lookup_queries(args.dataset, rnd)
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    weights = [SCENARIO_WEIGHTS[s] for s in scenarios]
+
+    latencies, errors, stages = defaultdict(list), defaultdict(int), defaultdict(list)
+    remaining = iter(range(args.requests))
+
+    async def worker(client):
+        for _ in remaining:
+            scenario = rnd.choices(scenarios, weights=weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await run_request(client, scenario, rnd, lookups)
+                ok = response.status_code < 500
+                for stage, elapsed in parse_server_timing(response.headers.get("Server-Timing")):
+                    stages[f"{scenario}/server.{stage}"].append(elapsed)
+            except httpx.HTTPError:
+                ok = False
+            latencies[scenario].append(time.perf_counter() - start)
+            if not ok:
+                errors[scenario] += 1
+
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        await asyncio.gather(*(worker(client) for _ in range(args.concurrency)))
+    wall = time.perf_counter() - started
+
+    results = {}
+    for scenario, samples in latencies.items():
+        results[scenario] = {**summarize(samples), "errors": errors[scenario], "rps": round(len(samples) / wall, 2)}
+    for key, samples in stages.items():
+        results[key] = summarize(samples)
+    return results, wall
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load test for the CV generation API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--dataset", default="1k", help="Synthetic dataset the server was started with (for lookup queries)")
+    parser.add_argument("--scenarios", default="suggestions,employee,cv_start")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Results file (default bench/results/load-<YYYYmmdd-HHMMSS>.json)")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 == 20%%)")
+    args = parser.parse_args()
+
+    results, wall = asyncio.run(run(args))
+    for key, stats in sorted(results.items()):
+        print(f"{key:<40} p50 {stats.get('p50_ms', 0):>9.1f} ms  p95 {stats.get('p95_ms', 0):>9.1f} ms  n={stats['n']}"
+              + (f"  errors={stats['errors']}  rps={stats['rps']}" if "errors" in stats else ""))
+    print(f"⏱️ {args.requests} requests in {wall:.1f}s")
+
+    path = save_results("load", results, args.output)
+    print(f"💾 Results saved to {path}")
+
+    if args.baseline and compare_results(results, args.baseline, threshold=args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
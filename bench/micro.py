@@ -0,0 +1,120 @@
+"""
+Micro-benchmarks for the RAG pipeline stages on synthetic data.
+
+    python -m bench.generate_data --sizes 1k,10k
+    python -m bench.micro --embedder hash
+    python -m bench.micro --embedder hash --baseline bench/results/micro-hash-<YYYYmmdd-HHMMSS>.json
+
+Stages: merge_records_on_the_fly, build_index, search, find_employee.
+`--embedder hash` replaces the SentenceTransformer with a cheap hashing
+encoder so merge / FAISS / lookup costs can be measured without CPU
+embedding; the model is then never loaded, but sentence-transformers must
+still be installed. Use `--embedder model` (default) for real numbers.
+
+100k is opt-in (`--sizes 100k`): merge_records_on_the_fly is quadratic in
+the number of employees (one merge takes ~1 min at 10k, ~2 h at 100k).
+"""
+import argparse
+import os
+import random
+import sys
+import zlib
+import numpy as np
+from bench.common import JOB_DESCRIPTIONS, compare_results, data_dir, parse_sizes, save_results, summarize, time_call
+from bench.generate_data import typo
+from services import rag_faiss
+
+class HashingEmbedder:
+    """Bag-of-words feature hashing with the same output shape as SentenceTransformer.encode."""
+
+    def __init__(self, dim: int = 768):
+        self.dim = dim
+
+    def encode(self, texts):
+        out = np.zeros((len(texts), self.dim), dtype="float32")
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                h = zlib.crc32(token.encode("utf-8"))
+                out[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return out
+
+def lookup_queries(records, rnd: random.Random, count: int):
+    """Mix of id, email, exact name and typo'd name queries, like users type them."""
+    queries = []
+    for rec in rnd.sample(records, min(count, len(records))):
+        kind = rnd.choice(["employee_id", "email", "full_name", "typo"])
+        if kind == "typo":
+            queries.append(typo(rnd, rec.get("full_name", "")))
+        else:
+            queries.append(str(rec.get(kind) or rec.get("full_name", "")))
+    return queries
+
+def default_repeat(n: int) -> int:
+    """Repeat merge on small datasets only; it takes minutes from 10k up."""
+    return 3 if n < 10_000 else 1
+
+def bench_size(size_name: str, repeat: int, queries: int, seed: int):
+    folder = data_dir(size_name)
+    if not os.path.exists(os.path.join(folder, "hrm.json")):
+        sys.exit(f"Missing {folder}; run `python -m bench.generate_data --sizes {size_name}` first.")
+    paths = {name: os.path.join(folder, f"{name}.json") for name in ["hrm", "xops", "custom"]}
+    rnd = random.Random(seed)
+    results = {}
+
+    merge_times = []
+    for _ in range(repeat):
+        elapsed, records = time_call(rag_faiss.merge_records_on_the_fly, paths["hrm"], paths["xops"], paths["custom"])
+        merge_times.append(elapsed)
+    results[f"{size_name}/merge_records"] = {**summarize(merge_times), "records": len(records)}
+    print(f"  merge_records: {results[f'{size_name}/merge_records']['p50_ms']:.1f} ms ({len(records)} records)")
+
+    elapsed, _ = time_call(rag_faiss.build_index, records)
+    results[f"{size_name}/build_index"] = summarize([elapsed])
+    print(f"  build_index:   {elapsed * 1000:.1f} ms")
+
+    search_times = []
+    for i in range(queries):
+        elapsed, _ = time_call(rag_faiss.search, JOB_DESCRIPTIONS[i % len(JOB_DESCRIPTIONS)], 5)
+        search_times.append(elapsed)
+    results[f"{size_name}/search"] = summarize(search_times)
+    print(f"  search:        {results[f'{size_name}/search']['p50_ms']:.2f} ms p50")
+
+    find_times = []
+    for query in lookup_queries(records, rnd, queries):
+        elapsed, _ = time_call(rag_faiss.find_employee, query)
+        find_times.append(elapsed)
+    results[f"{size_name}/find_employee"] = summarize(find_times)
+    print(f"  find_employee: {results[f'{size_name}/find_employee']['p50_ms']:.2f} ms p50")
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark merge, index build, search and employee lookup.")
+    parser.add_argument("--sizes", default="1k,10k", help="Dataset sizes generated by bench.generate_data (100k is opt-in)")
+    parser.add_argument("--embedder", choices=["model", "hash"], default="model")
+    parser.add_argument("--repeat", type=int, help="Repetitions of merge_records_on_the_fly (default 3 below 10k, else 1)")
+    parser.add_argument("--queries", type=int, default=50, help="Queries for search and find_employee")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Results file (default bench/results/micro-<embedder>-<YYYYmmdd-HHMMSS>.json)")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 == 20%%)")
+    args = parser.parse_args()
+
+    if args.embedder == "hash":
+        rag_faiss.model = HashingEmbedder()
+    # Load the model up front so the first build_index timing excludes it.
+    rag_faiss.get_model()
+
+    results = {}
+    for name, n in parse_sizes(args.sizes):
+        print(f"📊 {name}")
+        results.update(bench_size(name, args.repeat or default_repeat(n), args.queries, args.seed))
+
+    path = save_results(f"micro-{args.embedder}", results, args.output)
+    print(f"💾 Results saved to {path}")
+
+    if args.baseline and compare_results(results, args.baseline, threshold=args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+OpenAI-compatible stub LLM server for load tests.
+
+    uvicorn bench.stub_llm:app --port 8100
+    API_KEY=stub BASE_URL=http://127.0.0.1:8100/v1 CVGEN_DATA_DIR=bench/data/10k uvicorn main:app --port 8000
+
+Answers every /v1/chat/completions call with a valid CV after a configurable
+delay (STUB_LLM_LATENCY_MS, default 800), so load tests measure this API
+rather than the provider.
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+from fastapi import FastAPI, Request
+from lib.tokens import estimate_tokens
+
+LATENCY_MS = float(os.getenv("STUB_LLM_LATENCY_MS", "800"))
+
+STUB_CV = {
+    "personalInformation": {
+        "fullName": "Alice Johnson",
+        "position": ["Senior Software Engineer"],
+        "education": "BSc Computer Science",
+        "email": "alice.johnson@dummy.com",
+    },
+    "brief": "Senior software engineer with a decade of backend and cloud experience.",
+    "professionalSkills": {"coreLanguages": ["Python", "Go"], "frameworksAndTools": ["FastAPI", "Docker"]},
+    "languages": [{"language": "English", "level": "Fluent"}],
+    "hobbies": [],
+    "relevantProjects": [{
+        "businessDomain": "FinTech",
+        "projectDescription": "Developed backend APIs for payment processing",
+        "techStack": ["Python", "PostgreSQL"],
+        "roleAndResponsibilities": ["Developed backend APIs", "Led code reviews"],
+    }],
+}
+
+app = FastAPI()
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    prompt = "".join(m.get("content", "") for m in body.get("messages", []))
+    content = json.dumps(STUB_CV)
+    await asyncio.sleep(LATENCY_MS / 1000)
+    prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
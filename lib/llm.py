@@ -1,11 +1,13 @@
 import openai
 from pydantic_settings import BaseSettings
+from lib.metrics import span, record_llm_usage
 
 class Settings(BaseSettings):
     api_key: str
     base_url: str
     model: str = "l2-gpt-4o"
-    
+    prompt_token_budget: int = 6000
+
     class Config:
         env_file = ".env"
 
@@ -16,19 +18,28 @@ client = openai.OpenAI(
     base_url=settings.base_url,
 )
 
-def get_llm_response(question: str):
-    response = client.chat.completions.create(
-        model=settings.model,
-        messages=[
-            {
-                "role": "system",
-                "content": "You are helpful CV bot."
-            },
-            {
-                "role": "user",
-                "content": question
-            },
-        ]
-    )
-
-    return response
\ No newline at end of file
+SYSTEM_PROMPT = "You are helpful CV bot."
+
+def get_llm_response(question: str, system: str = SYSTEM_PROMPT, label: str = "chat"):
+    """
+    Send a chat completion request. Keep `system` static across calls and put
+    per-request data in `question`, so the prompt starts with a stable prefix.
+    """
+    with span(f"llm.{label}"):
+        response = client.chat.completions.create(
+            model=settings.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system
+                },
+                {
+                    "role": "user",
+                    "content": question
+                },
+            ]
+        )
+
+    record_llm_usage(label, getattr(response, "usage", None))
+
+    return response
@@ -0,0 +1,99 @@
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+STAGE_LATENCY = Histogram(
+    "cvgen_stage_duration_seconds",
+    "Time spent in a pipeline stage (merge, embed, search, llm, parse, ...).",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+STAGE_ERRORS = Counter(
+    "cvgen_stage_errors_total",
+    "Exceptions raised inside a pipeline stage.",
+    ["stage"],
+)
+REQUEST_LATENCY = Histogram(
+    "cvgen_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=STAGE_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "cvgen_llm_tokens_total",
+    "Tokens reported by the LLM provider.",
+    ["label", "kind"],
+)
+
+# Spans recorded during the current HTTP request, as (stage, seconds) pairs.
+# Set by timing_middleware; None outside a request (e.g. at startup).
+_request_spans: ContextVar = ContextVar("request_spans", default=None)
+
+@contextmanager
+def span(stage: str):
+    """Time a block, record it in the stage histogram and the current request's spans."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_LATENCY.labels(stage).observe(elapsed)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((stage, elapsed))
+
+def timed(stage: str):
+    """Decorator form of span()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_llm_usage(label: str, usage):
+    if usage is None:
+        return
+    cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None) or 0
+    LLM_TOKENS.labels(label, "prompt").inc(usage.prompt_tokens or 0)
+    LLM_TOKENS.labels(label, "cached").inc(cached)
+    LLM_TOKENS.labels(label, "completion").inc(usage.completion_tokens or 0)
+    logger.info("%s: %s prompt tokens (%s cached), %s completion tokens",
+                label, usage.prompt_tokens, cached, usage.completion_tokens)
+
+def server_timing(spans) -> str:
+    return ", ".join(f'{stage.replace(" ", "_")};dur={elapsed * 1000:.1f}' for stage, elapsed in spans)
+
+async def timing_middleware(request, call_next):
+    """
+    Time every request, and return the breakdown of stages it ran through
+    in a Server-Timing header (visible in browser devtools).
+    """
+    spans = []
+    token = _request_spans.set(spans)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        elapsed = time.perf_counter() - start
+        _request_spans.reset(token)
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        REQUEST_LATENCY.labels(request.method, route_path, str(status)).observe(elapsed)
+        logger.info("%s %s %s %.1fms %s", request.method, route_path, status, elapsed * 1000, server_timing(spans))
+
+    response.headers["Server-Timing"] = server_timing(spans + [("total", elapsed)])
+    return response
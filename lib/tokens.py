@@ -0,0 +1,76 @@
+import copy
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio for English/JSON text on GPT-4-class tokenizers.
+# Good enough for budgeting; the provider's exact count is reported per call.
+CHARS_PER_TOKEN = 4
+
+HISTORY_FIELD = "work_experience"
+# merge_records_on_the_fly folds these into work_experience; sending both
+# would put every job in the prompt twice.
+MERGED_HISTORY_FIELDS = ["employment_history", "projects"]
+# Trimmed after history runs out; merge extends these from every matched custom row.
+LIST_FIELDS = ["endorsements", "skills"]
+
+def compact_json(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def estimate_tokens(text: str) -> int:
+    return (len(text or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def summarize_entry(entry):
+    name = entry.get("project_name") or entry.get("organization") or ""
+    role = entry.get("role", "")
+    dates = "–".join(d for d in [entry.get("start_date"), entry.get("end_date")] if d)
+    parts = [p for p in [role, name] if p]
+    label = " @ ".join(parts) or "Unknown role"
+    return f"{label} ({dates})" if dates else label
+
+def oldest_entry_index(entries):
+    """Index of the oldest entry; undated entries count as most recent."""
+    return min(range(len(entries)), key=lambda i: entries[i].get("start_date") or "9999-12-31")
+
+def without_merged_history(employee_record):
+    """Drop history fields already folded into work_experience (shallow copy)."""
+    if HISTORY_FIELD not in employee_record:
+        return employee_record
+    return {k: v for k, v in employee_record.items() if k not in MERGED_HISTORY_FIELDS}
+
+def fit_record_to_budget(employee_record, max_tokens: int):
+    """
+    Return a copy of employee_record whose compact JSON fits in max_tokens.
+    Oldest work_experience entries are dropped first and replaced by a one-line
+    summary in `earlier_experience`, so the LLM still sees them by name. Then
+    endorsements and skills are deduplicated and truncated. Logs a warning if
+    the record still does not fit. The original record is never modified.
+    """
+    rec = copy.deepcopy(employee_record)
+    if estimate_tokens(compact_json(rec)) <= max_tokens:
+        return rec
+
+    dropped = []
+    entries = rec.get(HISTORY_FIELD) or []
+    while entries and estimate_tokens(compact_json(rec)) > max_tokens:
+        entry = entries.pop(oldest_entry_index(entries))
+        summary = summarize_entry(entry)
+        if summary not in dropped:
+            dropped.append(summary)
+        rec["earlier_experience"] = "; ".join(dropped)
+
+    for field in LIST_FIELDS:
+        if estimate_tokens(compact_json(rec)) <= max_tokens:
+            break
+        values = rec.get(field) or []
+        values[:] = list(dict.fromkeys(values))
+        while values and estimate_tokens(compact_json(rec)) > max_tokens:
+            values.pop()
+
+    tokens = estimate_tokens(compact_json(rec))
+    if tokens > max_tokens:
+        logger.warning("Employee record %s is %d tokens, over the %d token budget after trimming",
+                       rec.get("employee_id", ""), tokens, max_tokens)
+
+    return rec
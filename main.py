@@ -3,8 +3,12 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from contextlib import asynccontextmanager
 import asyncio
+import logging
+from lib.metrics import timing_middleware
 from services import rag_faiss
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
@@ -32,10 +36,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
-from api import rag, helpers, cv
+app.middleware("http")(timing_middleware)
+
+from api import rag, helpers, cv, metrics
 
 app.include_router(rag.router, prefix="/rag", tags=["RAG"])
 app.include_router(helpers.router, prefix="/helpers", tags=["Helpers"])
-app.include_router(cv.router, prefix="/cv", tags=["CV"])
\ No newline at end of file
+app.include_router(cv.router, prefix="/cv", tags=["CV"])
+app.include_router(metrics.router, tags=["Metrics"])
\ No newline at end of file
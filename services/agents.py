@@ -1,8 +1,13 @@
 import json
+import logging
 import re
 from typing import List
 from pydantic import BaseModel, EmailStr
-from lib.llm import get_llm_response
+from lib.llm import SYSTEM_PROMPT, get_llm_response, settings
+from lib.tokens import compact_json, estimate_tokens, fit_record_to_budget, without_merged_history
+from lib.metrics import span, timed
+
+logger = logging.getLogger(__name__)
 
 class LanguageLevel(BaseModel):
     language: str
@@ -35,103 +40,131 @@ class CVSchema(BaseModel):
 def cv_to_json(cv: CVSchema) -> str:
     return cv.model_dump_json(indent=2)
 
-class DraftingAgent:
-    def generate(self, employee_record):
-        empty_cv = CVSchema(
-            personalInformation=PersonalInformation(fullName="", position=[], education="", email="example@example.com"),
-            brief="",
-            professionalSkills=ProfessionalSkills(coreLanguages=[], frameworksAndTools=[]),
-            languages=[],
-            hobbies=[],
-            relevantProjects=[]
-        )
-        prompt = f"""Convert employee data to CV JSON:
-
-INPUT DATA:
-{employee_record}
+def empty_cv() -> CVSchema:
+    return CVSchema(
+        personalInformation=PersonalInformation(fullName="", position=[], education="", email="example@example.com"),
+        brief="",
+        professionalSkills=ProfessionalSkills(coreLanguages=[], frameworksAndTools=[]),
+        languages=[],
+        hobbies=[],
+        relevantProjects=[]
+    )
+
+# Static prompt prefixes: built once at import so every call sends a
+# byte-identical system message, with per-request data after it as compact
+# JSON. At 150-450 tokens they are below the 1024-token minimum for
+# OpenAI-style automatic prompt caching, so expect no cache hits yet.
+CV_SCHEMA_EXAMPLE = cv_to_json(empty_cv())
+
+DRAFTING_PROMPT = f"""{SYSTEM_PROMPT}
+Convert employee data to CV JSON.
 
 OUTPUT SCHEMA:
-{cv_to_json(empty_cv)}
+{CV_SCHEMA_EXAMPLE}
 
 MAPPING RULES:
 1. personalInformation: Map full_name→fullName, current_role→position (as array), education, email
 2. brief: Generate 2-3 sentence professional summary from role, experience, and skills. NEVER leave empty.
-3. relevantProjects: Combine ALL entries from employment_history + work_experience + projects arrays. Format each as:
+3. relevantProjects: Use ALL entries from work_experience (falling back to employment_history + projects if it is absent). Format each as:
    - businessDomain: Infer from role/responsibilities or use "General Software Development"
    - projectDescription: Use responsibilities field
    - techStack: Extract technologies from responsibilities or use empty array
    - roleAndResponsibilities: Convert responsibilities string to bullet points array
    Sort by start_date descending. CRITICAL: Never leave empty if work history exists.
+   If earlier_experience is present, add one entry summarizing those earlier roles.
 4. professionalSkills: Distribute skills array between coreLanguages (programming languages) and frameworksAndTools (frameworks/tools/technologies)
 5. languages: Add {{"language": "English", "level": "Fluent"}} if position contains Senior/Lead/Principal/Staff/Architect/Manager
 6. hobbies: Use endorsements array if available, otherwise empty
 7. Preserve ALL data from input - never discard information
 
+The user message contains the INPUT DATA as JSON.
 Return only valid JSON matching the schema. No markdown, no explanations."""
 
-        result = get_llm_response(prompt)
+REVIEW_PROMPT = f"""{SYSTEM_PROMPT}
+You are a CV expert.
+
+CV SCHEMA:
+{CV_SCHEMA_EXAMPLE}
+
+The user message contains the CV DRAFT as JSON followed by FEEDBACK.
+Your task is to modify the CV based on the feedback. The result should be a refined CV with the feedback fully applied.
+Make sure the feedback is directly incorporated into the CV. You **must** modify the CV draft in line with the feedback provided, not just review it.
+
+Return the updated CV JSON, in the same structure as the original draft. No markdown, no explanations."""
+
+REFINEMENT_PROMPT = f"""{SYSTEM_PROMPT}
+Refine CV draft based on feedback.
+
+CV SCHEMA:
+{CV_SCHEMA_EXAMPLE}
+
+The user message contains ORIGINAL DATA, CURRENT CV and FEEDBACK TO ADDRESS, each as JSON.
+Return refined CV JSON matching schema. No markdown, no explanations.
+Important: Make sure output you give is indeed refined, and never same as input."""
+
+def budget_employee_record(employee_record, fixed_text: str = ""):
+    """Trim employee_record so prefix + fixed_text + record fit the prompt token budget."""
+    used = estimate_tokens(fixed_text)
+    return fit_record_to_budget(without_merged_history(employee_record), max(settings.prompt_token_budget - used, 0))
+
+def parse_cv(result) -> dict:
+    content = result.choices[0].message.content
+    content = re.sub(r"^```json\s*|\s*```$", "", content.strip(), flags=re.DOTALL)
+    with span("parse_json"):
+        draft_json = json.loads(content)
+    with span("validate_cv"):
+        return CVSchema(**draft_json).model_dump()
+
+class DraftingAgent:
+    @timed("agent.draft")
+    def generate(self, employee_record):
+        record = budget_employee_record(employee_record, DRAFTING_PROMPT)
+        prompt = f"INPUT DATA:\n{compact_json(record)}"
+
+        result = get_llm_response(prompt, system=DRAFTING_PROMPT, label="DraftingAgent")
         try:
-            content = result.choices[0].message.content
-            content = re.sub(r"^```json\s*|\s*```$", "", content.strip(), flags=re.DOTALL)
-            draft_json = json.loads(content)
-            draft = CVSchema(**draft_json).model_dump()
-        except Exception as e:
-            print(f"Draft generation error: {e}")
-            draft = empty_cv.model_dump()
+            draft = parse_cv(result)
+        except Exception:
+            logger.exception("Draft generation error")
+            draft = empty_cv().model_dump()
 
         return {"cv": draft, "feedbackHistory": [], "lastFeedback": "", "feedback": []}
 
 class ReviewAgent:
+    @timed("agent.review")
     def review(self, draft, feedback):
         """Apply feedback directly to the CV draft."""
-        prompt = f"""You are a CV expert. 
-
-CV DRAFT:
-{json.dumps(draft['cv'], indent=2)}
+        prompt = f"""CV DRAFT:
+{compact_json(draft['cv'])}
 
 FEEDBACK:
-{feedback}
-
-Your task is to modify the CV based on the feedback. The result should be a refined CV with the feedback fully applied. 
-Make sure the feedback is directly incorporated into the CV. You **must** modify the CV draft in line with the feedback provided, not just review it.
-
-Return the updated CV JSON, in the same structure as the original draft.
-"""
-        result = get_llm_response(prompt)
+{feedback}"""
+        result = get_llm_response(prompt, system=REVIEW_PROMPT, label="ReviewAgent")
         try:
-            content = result.choices[0].message.content
-            content = re.sub(r"^```json\s*|\s*```$", "", content.strip(), flags=re.DOTALL)
-            draft_json = json.loads(content)
-            draft['cv'] = CVSchema(**draft_json).model_dump()
-        except Exception as e:
-            print(f"Review error: {e}")
+            draft['cv'] = parse_cv(result)
+        except Exception:
+            logger.exception("Review error")
 
         return draft
 
 class RefinementAgent:
+    @timed("agent.refine")
     def refine(self, draft, employee_record):
-        prompt = f"""Refine CV draft based on feedback:
-
-ORIGINAL DATA:
-{employee_record}
-
-CURRENT CV:
-{json.dumps(draft['cv'], indent=2)}
+        tail = f"""CURRENT CV:
+{compact_json(draft['cv'])}
 
 FEEDBACK TO ADDRESS:
-{json.dumps(draft.get('feedback', []), indent=2)}
+{compact_json(draft.get('feedback', []))}"""
+        record = budget_employee_record(employee_record, REFINEMENT_PROMPT + tail)
+        prompt = f"""ORIGINAL DATA:
+{compact_json(record)}
 
-Return refined CV JSON matching schema.
-Important: Make sure output you give is indeed refined, and never same as input.
-"""
-        result = get_llm_response(prompt)
+{tail}"""
+        result = get_llm_response(prompt, system=REFINEMENT_PROMPT, label="RefinementAgent")
         try:
-            content = result.choices[0].message.content
-            content = re.sub(r"^```json\s*|\s*```$", "", content.strip(), flags=re.DOTALL)
-            draft_json = json.loads(content)
-            draft['cv'] = CVSchema(**draft_json).model_dump()
-        except Exception as e:
-            print(f"Refinement error: {e}")
+            draft['cv'] = parse_cv(result)
+        except Exception:
+            logger.exception("Refinement error")
 
         draft['lastFeedback'] = draft.get('feedback', [])[-1] if draft.get('feedback') else draft.get('lastFeedback', "")
         return draft
@@ -3,8 +3,11 @@ import os, json
 from collections import defaultdict
 import faiss, numpy as np
 from sentence_transformers import SentenceTransformer
+from lib.metrics import span, timed
 
-model = SentenceTransformer("all-mpnet-base-v2")
+MODEL_NAME = "all-mpnet-base-v2"
+model = None
+DATA_DIR = os.getenv("CVGEN_DATA_DIR", "data")
 index = None
 records, vectors = [], []
 
@@ -45,7 +48,9 @@ def find_best_match(rec, unified):
         if u.get("phone", "").lower() == phone and phone:
             return k
 
-    # Try fuzzy full_name match
+    # Try fuzzy full_name match; a missing name would match every other nameless entry
+    if not full_name_norm:
+        return None
     names = [normalize_string(u.get("full_name", "")) for u in unified.values()]
     matches = get_close_matches(full_name_norm, names, n=1, cutoff=0.8)
     if matches:
@@ -56,7 +61,14 @@ def find_best_match(rec, unified):
 
     return None
 
-def merge_records_on_the_fly(hrm_path="data/hrm.json", xops_path="data/xops.json", custom_path="data/custom.json"):
+def fill_identity(target, rec):
+    """Copy identifying fields from rec that target (e.g. an entry missing from HRM) lacks."""
+    for field in ["employee_id", "full_name", "email", "phone"]:
+        if rec.get(field) and not target.get(field):
+            target[field] = rec[field]
+
+@timed("merge_records")
+def merge_records_on_the_fly(hrm_path=os.path.join(DATA_DIR, "hrm.json"), xops_path=os.path.join(DATA_DIR, "xops.json"), custom_path=os.path.join(DATA_DIR, "custom.json")):
     hrm = load_json(hrm_path)
     xops = load_json(xops_path)
     custom = load_json(custom_path)
@@ -73,6 +85,7 @@ def merge_records_on_the_fly(hrm_path="data/hrm.json", xops_path="data/xops.json
         if not key:
             # Create new entry if no match
             key = normalize_string(rec.get("employee_id", "new_" + str(len(unified)+1)))
+        fill_identity(unified[key], rec)
         unified[key].setdefault("projects", [])
         for proj in rec.get("projects", []):
             unified[key]["projects"].append({
@@ -88,6 +101,7 @@ def merge_records_on_the_fly(hrm_path="data/hrm.json", xops_path="data/xops.json
         key = find_best_match(rec, unified)
         if not key:
             key = normalize_string(rec.get("employee_id", "new_" + str(len(unified)+1)))
+        fill_identity(unified[key], rec)
         unified[key].setdefault("endorsements", [])
         unified[key].setdefault("skills", [])
         unified[key]["business_context"] = rec.get("business_context", unified[key].get("business_context", ""))
@@ -164,29 +178,42 @@ def serialize_record(rec, mode="summary"):
         return " | ".join(parts).lower()
     return generate_record_summary(rec)
 
+def get_model():
+    """Load the embedding model on first use, not at import."""
+    global model
+    if model is None:
+        model = SentenceTransformer(MODEL_NAME)
+    return model
+
 def vectorize_text(text):
-    return model.encode([text])[0]
+    return get_model().encode([text])[0]
 
 def normalize(vec):
     return vec if np.linalg.norm(vec) == 0 else vec / np.linalg.norm(vec)
 
+@timed("build_index")
 def build_index(records_list, mode="summary"):
     global index, vectors, records
     vectors, records = [], []
-    for rec in records_list:
-        vec = normalize(vectorize_text(serialize_record(rec, mode)))
-        vectors.append(vec)
-        records.append(rec)
+    with span("build_index.embed"):
+        for rec in records_list:
+            vec = normalize(vectorize_text(serialize_record(rec, mode)))
+            vectors.append(vec)
+            records.append(rec)
     if not vectors:
         raise ValueError("No vectors to index.")
-    index = faiss.IndexFlatIP(len(vectors[0]))
-    index.add(np.array(vectors).astype("float32"))
+    with span("build_index.faiss_add"):
+        index = faiss.IndexFlatIP(len(vectors[0]))
+        index.add(np.array(vectors).astype("float32"))
 
+@timed("search_similar")
 def search_similar(query, top_k=3):
     if index is None:
         raise ValueError("FAISS index not initialized.")
-    q_vec = normalize(vectorize_text(query)).astype("float32").reshape(1, -1)
-    scores, indices = index.search(q_vec, top_k)
+    with span("search_similar.embed"):
+        q_vec = normalize(vectorize_text(query)).astype("float32").reshape(1, -1)
+    with span("search_similar.faiss_search"):
+        scores, indices = index.search(q_vec, top_k)
     return [(int(idx), float(scores[0][i])) for i, idx in enumerate(indices[0]) if idx != -1]
 
 def search_with_scores(query, top_k=5):
@@ -206,6 +233,7 @@ def get_records_by_indices(indices):
 def preview_index(num_records=5):
     return records[:num_records] if records else []
 
+@timed("find_employee")
 def find_employee(query, min_score=0.4):
     """
     Find an employee by ID, name, email, or phone, allowing typos and partial matches.
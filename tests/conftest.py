@@ -0,0 +1,5 @@
+import os
+
+# lib.llm builds Settings at import; tests never reach a real provider.
+os.environ.setdefault("API_KEY", "test")
+os.environ.setdefault("BASE_URL", "http://127.0.0.1:9/v1")
@@ -0,0 +1,15 @@
+import json
+from bench.generate_data import ORPHAN_RATE, write_dataset
+from services import rag_faiss
+
+def test_1k_merges_into_hrm_employees_plus_orphans(tmp_path):
+    write_dataset(str(tmp_path), 1000, seed=42)
+    hrm_ids = {r["employee_id"] for r in json.loads((tmp_path / "hrm.json").read_text(encoding="utf-8"))}
+
+    records = rag_faiss.merge_records_on_the_fly(
+        str(tmp_path / "hrm.json"), str(tmp_path / "xops.json"), str(tmp_path / "custom.json"))
+
+    orphans = int(1000 * ORPHAN_RATE)
+    assert len(hrm_ids) == 1000 - orphans
+    assert len(records) == len(hrm_ids) + orphans
+    assert len({r["employee_id"] for r in records}) == len(records)
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+import main
+from lib.metrics import span
+from services import agents, rag_faiss
+
+EMPLOYEE = {
+    "employee_id": "0044",
+    "full_name": "Alice Johnson",
+    "email": "alice.johnson@dummy.com",
+    "phone": "+1-555-0101",
+    "current_role": "Senior Software Engineer",
+    "work_experience": [],
+}
+
+def fake_llm_response(question, system=None, label="chat"):
+    content = agents.cv_to_json(agents.empty_cv())
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(rag_faiss, "records", [EMPLOYEE])
+    monkeypatch.setattr(agents, "get_llm_response", fake_llm_response)
+    return TestClient(main.app)
+
+def test_span_counts_errors_and_reraises():
+    labels = {"stage": "test.failing"}
+    before = REGISTRY.get_sample_value("cvgen_stage_errors_total", labels) or 0
+
+    with pytest.raises(ValueError):
+        with span("test.failing"):
+            raise ValueError("boom")
+
+    assert REGISTRY.get_sample_value("cvgen_stage_errors_total", labels) == before + 1
+    assert REGISTRY.get_sample_value("cvgen_stage_duration_seconds_count", labels) >= 1
+
+def test_cv_start_reports_server_timing(client):
+    response = client.post("/cv/start/alice")
+
+    assert response.status_code == 200
+    stages = [part.split(";")[0] for part in response.headers["Server-Timing"].split(", ")]
+    for stage in ["find_employee", "agent.draft", "parse_json", "total"]:
+        assert stage in stages
+
+def test_metrics_endpoint_reports_route_template(client):
+    client.post("/cv/start/alice")
+
+    body = client.get("/metrics").text
+
+    assert 'cvgen_http_request_duration_seconds_count{method="POST",route="/cv/start/{employee_query}",status="200"}' in body
+    assert 'cvgen_stage_duration_seconds_count{stage="agent.draft"}' in body
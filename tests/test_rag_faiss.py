@@ -0,0 +1,56 @@
+import json
+from services import rag_faiss
+
+HRM = [{
+    "employee_id": "0044",
+    "full_name": "Alice Johnson",
+    "email": "alice.johnson@dummy.com",
+    "phone": "+1-555-0101",
+    "current_role": "Senior Software Engineer",
+}]
+
+def project(project_id):
+    return {"project_id": project_id, "project_name": "Payment Gateway", "role": "Backend Developer"}
+
+def merge(tmp_path, hrm=(), xops=(), custom=()):
+    paths = []
+    for name, rows in [("hrm", hrm), ("xops", xops), ("custom", custom)]:
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(list(rows)), encoding="utf-8")
+        paths.append(str(path))
+    return rag_faiss.merge_records_on_the_fly(*paths)
+
+def test_nameless_rows_do_not_fold_into_each_other(tmp_path):
+    xops = [
+        {"employee_id": "X1", "projects": [project("P1")]},
+        {"employee_id": "X2", "projects": [project("P2")]},
+    ]
+
+    records = merge(tmp_path, HRM, xops)
+
+    assert len(records) == 3
+    by_id = {r.get("employee_id"): r for r in records}
+    assert [p["project_id"] for p in by_id["X1"]["projects"]] == ["P1"]
+    assert [p["project_id"] for p in by_id["X2"]["projects"]] == ["P2"]
+
+def test_non_hrm_entry_gets_identity_fields(tmp_path):
+    xops = [{"employee_id": "C9", "full_name": "Ivan Okafor", "email": "ivan.okafor@dummy.com",
+             "projects": [project("P1")]}]
+
+    records = merge(tmp_path, HRM, xops)
+
+    new = next(r for r in records if r.get("employee_id") == "C9")
+    assert new["full_name"] == "Ivan Okafor"
+    assert new["email"] == "ivan.okafor@dummy.com"
+
+def test_hrm_identity_is_never_overwritten(tmp_path):
+    custom = [{"employee_id": "X7", "full_name": "Alicia Jonson", "email": "ALICE.JOHNSON@dummy.com",
+               "phone": "+1-555-9999", "skills": ["Python"]}]
+
+    records = merge(tmp_path, HRM, custom=custom)
+
+    assert len(records) == 1
+    rec = records[0]
+    assert rec["skills"] == ["Python"]
+    assert {k: rec[k] for k in ["employee_id", "full_name", "email", "phone"]} == \
+        {k: HRM[0][k] for k in ["employee_id", "full_name", "email", "phone"]}
@@ -0,0 +1,85 @@
+import logging
+from lib.tokens import compact_json, estimate_tokens, fit_record_to_budget, without_merged_history
+
+def merged_record():
+    """Shaped like merge_records_on_the_fly output: history is in work_experience and its sources."""
+    employment = [
+        {"role": "Junior Developer", "start_date": "2016-01-15", "end_date": "2018-02-28",
+         "responsibilities": "Wrote unit tests, fixed bugs, code reviews"},
+        {"role": "Frontend Developer", "start_date": "2018-03-01", "end_date": "2020-06-30",
+         "responsibilities": "Built reusable UI components"},
+    ]
+    projects = [
+        {"project_id": "P1001", "project_name": "Payment Gateway", "role": "Backend Developer",
+         "responsibilities": "Developed APIs for payment processing", "performance_metrics": {}},
+    ]
+    work_experience = [{"type": "employment", "organization": "Unknown", **job} for job in employment]
+    work_experience += [{"type": "project", **proj} for proj in projects]
+    return {
+        "employee_id": "0044",
+        "full_name": "Alice Johnson",
+        "current_role": "Senior Software Engineer",
+        "skills": ["Python", "Go"],
+        "endorsements": [],
+        "employment_history": employment,
+        "projects": projects,
+        "work_experience": work_experience,
+    }
+
+def tokens(rec):
+    return estimate_tokens(compact_json(rec))
+
+def test_without_merged_history_keeps_only_work_experience():
+    rec = merged_record()
+    projected = without_merged_history(rec)
+    assert "employment_history" not in projected and "projects" not in projected
+    assert projected["work_experience"] == rec["work_experience"]
+    assert "employment_history" in rec
+
+def test_fit_record_within_budget_is_unchanged_copy():
+    rec = without_merged_history(merged_record())
+    fitted = fit_record_to_budget(rec, tokens(rec))
+    assert fitted == rec and fitted is not rec
+    assert "earlier_experience" not in fitted
+
+def test_fit_record_drops_oldest_and_summarizes_once():
+    rec = without_merged_history(merged_record())
+    fitted = fit_record_to_budget(rec, tokens(rec) - 20)
+
+    roles = [x["role"] for x in fitted["work_experience"]]
+    assert roles == ["Frontend Developer", "Backend Developer"]
+    assert fitted["earlier_experience"] == "Junior Developer @ Unknown (2016-01-15–2018-02-28)"
+    assert tokens(fitted) <= tokens(rec) - 20
+    assert len(rec["work_experience"]) == 3
+
+def test_fit_record_drops_dated_entries_before_undated_projects():
+    rec = without_merged_history(merged_record())
+    expected = {
+        **rec,
+        "work_experience": rec["work_experience"][2:],
+        "earlier_experience": "Junior Developer @ Unknown (2016-01-15–2018-02-28); "
+                              "Frontend Developer @ Unknown (2018-03-01–2020-06-30)",
+    }
+
+    assert fit_record_to_budget(rec, tokens(expected)) == expected
+
+def test_fit_record_truncates_skills_after_history(caplog):
+    rec = without_merged_history(merged_record())
+    rec["skills"] = ["Python", "Go"] * 50 + [f"Skill {i}" for i in range(50)]
+    summary = fit_record_to_budget(rec, 0)["earlier_experience"]
+    budget = tokens({**rec, "skills": ["Python", "Go"], "work_experience": [], "earlier_experience": summary})
+
+    caplog.clear()
+    fitted = fit_record_to_budget(rec, budget)
+
+    assert fitted["work_experience"] == []
+    assert fitted["skills"] == ["Python", "Go"]
+    assert tokens(fitted) <= budget
+    assert "over the" not in caplog.text
+
+def test_fit_record_warns_when_budget_cannot_be_met(caplog):
+    rec = without_merged_history(merged_record())
+    with caplog.at_level(logging.WARNING, logger="lib.tokens"):
+        fitted = fit_record_to_budget(rec, 10)
+    assert fitted["work_experience"] == [] and fitted["skills"] == []
+    assert "over the 10 token budget" in caplog.text